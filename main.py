@@ -9,19 +9,24 @@ Python 3.12+
 """
 
 import csv
+import ctypes
+import math
 import os
+import queue
 import sys
+import threading
 import time
-import queue
-from datetime import datetime
+from datetime import datetime, timedelta
 import numpy as np
 import sounddevice as sd
+from numba import njit
 
 # ============ CONFIG ============
 SAMPLE_RATE = 44100          # 44.1 kHz (more stable on Mac)
 CHANNELS = 1
-# If 0, PortAudio will choose the optimal callback buffer size automatically.
-CALLBACK_BLOCKSIZE = 0
+# Fixed callback buffer size (~93 ms at 44.1 kHz): every block has the same shape,
+# so the EMA alpha stays cached. If 0, PortAudio chooses (and may vary) the size.
+CALLBACK_BLOCKSIZE = 4096
 # IMPORTANT: high latency gives larger internal buffer => fewer overflows.
 LATENCY = "high"             # can also be a number in seconds, e.g. 0.2
 # Smoothing/detection
@@ -34,17 +39,181 @@ STOP_HOLD_S = 5.0
 EVENTS_CSV = "train_events.csv"
 WRITE_LEVELS_CSV = False
 LEVELS_CSV = "noise_levels.csv"
+# Log files stay open; buffered rows are flushed every N lines or M seconds.
+CSV_BUFFER_SIZE = 64 * 1024
+FLUSH_EVERY_LINES = 64
+FLUSH_INTERVAL_S = 0.5
+# Rows are preformatted; keep csv.writer's default line ending
+CSV_EOL = "\r\n"
+LOG_QUEUE_SIZE = 10000
+# Upper bound on how long detection or shutdown waits for the CSV writer thread
+LOG_WAIT_S = 2.0
 # Input device (None = default, or index/substring of device name)
 INPUT_DEVICE = None
 # ============ /CONFIG ===========
 
-# Queue from callback -> main thread: (rms_block, frames, timestamp)
-q = queue.Queue(maxsize=1000)
+# Lock-free SPSC ring buffer from callback -> main thread: (rms_block, frames, t_mono).
+# The callback only advances rb_head, the main thread only advances rb_tail, so no
+# Python lock is ever taken on the PortAudio realtime thread.
+RB_SIZE = 1024               # must be a power of two
+RB_MASK = RB_SIZE - 1
+rb_rms = np.empty(RB_SIZE, dtype=np.float32)
+rb_frames = np.empty(RB_SIZE, dtype=np.int32)
+rb_ts = np.empty(RB_SIZE, dtype=np.float64)
+rb_head = ctypes.c_uint64(0)
+rb_tail = ctypes.c_uint64(0)
+# Main thread sleep when the ring is empty: half a block period (~46 ms at 4096
+# frames), so it wakes about twice per block; 5 ms floor if PortAudio picks the size.
+POLL_INTERVAL_S = max(0.005, CALLBACK_BLOCKSIZE / SAMPLE_RATE / 2)
+# macOS thread QoS classes (<sys/qos.h>)
+QOS_CLASS_USER_INITIATED = 0x19
+QOS_CLASS_UTILITY = 0x11
+# Input overflows are counted in the callback and reported on this period
+OVERFLOW_REPORT_S = 5.0
 overflow_count = 0
+# Detector states; status label logged per block is indexed by state
+STATE_IDLE, STATE_CANDIDATE, STATE_ACTIVE = 0, 1, 2
+STATE_STATUS = ("idle", "idle", "train_active")
+# Slots of the detector state carried between run_detector() calls:
+# float64 timestamps/counters, float32 levels (same precision as the input)
+(ST_MODE, ST_CANDIDATE_SINCE, ST_EVENT_START, ST_LAST_ABOVE,
+ ST_EVENT_BLOCKS, ST_ALPHA_FRAMES) = range(6)
+DET_STATE_SIZE = 6
+LV_EMA, LV_EVENT_SUM, LV_EVENT_PEAK, LV_ALPHA = range(4)
+DET_LEVELS_SIZE = 4
+# Columns of the finished-event records returned by run_detector()
+EV_START, EV_END, EV_AVG_RMS, EV_PEAK_RMS, EV_BLOCKS = range(5)
+# Wall-clock anchor: the callback only records time.monotonic(), which is
+# converted to a local datetime in the main thread when a row is logged. The
+# anchor is refreshed per logged batch so DST changes, sleep and NTP steps are
+# picked up (time.monotonic() does not advance while macOS sleeps).
+T0_WALL = datetime.now().astimezone()
+T0_MONO = time.monotonic()
+
+# Explicit signature => compiled (or loaded from cache) at import, so the first
+# callback never runs the JIT on the realtime thread.
+@njit("float64(float32[:, :], int64, int64)", cache=True, fastmath=True, nogil=True)
+def _rms_f32(buf, nframes, nch):
+    # Fused mono downmix + sum of squares: one pass, no scratch buffer needed.
+    s = 0.0
+    if nch == 1:
+        # Mono input (the default): plain dot product, vectorizes like sdot.
+        for i in range(nframes):
+            x = buf[i, 0]
+            s += x * x
+        return math.sqrt(s / max(1, nframes) + 1e-12)
+    for i in range(nframes):
+        acc = 0.0
+        for c in range(nch):
+            acc += buf[i, c]
+        acc /= nch
+        s += acc * acc
+    return math.sqrt(s / max(1, nframes) + 1e-12)
+
+@njit("void(float32[:, :], int64, int64, int64, float32[:], int32[:])", cache=True, nogil=True)
+def _store_block(buf, nframes, nch, idx, out_rms, out_frames):
+    # Writes the block's RMS and frame count straight into ring slot idx, so the
+    # callback never boxes the result into a Python float.
+    out_rms[idx] = _rms_f32(buf, nframes, nch)
+    out_frames[idx] = nframes
+
+# nogil: the PortAudio callback is Python too, so it must never wait for the GIL
+# while the main thread is inside a batch.
+@njit(cache=True, nogil=True)
+def run_detector(rb_rms, rb_frames, rb_ts, lo, hi, rms_thr_low, rms_thr_high,
+                 state, levels, out_smooth, out_mode, out_events):
+    # Advance EMA + detector over ring slots lo..hi-1. Per-block smoothed RMS and
+    # state go to out_smooth/out_mode (for the levels CSV), finished events to
+    # out_events. Returns the number of events written.
+    one = np.float32(1.0)
+    thr_low = np.float32(rms_thr_low)
+    thr_high = np.float32(rms_thr_high)
+    ema = levels[LV_EMA]
+    mode = int(state[ST_MODE])
+    candidate_since = state[ST_CANDIDATE_SINCE]
+    event_start = state[ST_EVENT_START]
+    last_above = state[ST_LAST_ABOVE]
+    event_blocks = int(state[ST_EVENT_BLOCKS])
+    event_sum = levels[LV_EVENT_SUM]
+    event_peak = levels[LV_EVENT_PEAK]
+    # One-entry alpha cache: PortAudio almost always repeats the same frame count
+    alpha_frames = int(state[ST_ALPHA_FRAMES])
+    a = levels[LV_ALPHA]
+    n_events = 0
+
+    for k in range(hi - lo):
+        idx = (lo + k) & RB_MASK
+        x = rb_rms[idx]
+        t = rb_ts[idx]
+
+        # EMA; ema < 0 means "not started"
+        if ema < 0.0:
+            ema = x
+        else:
+            frames = rb_frames[idx]
+            if frames != alpha_frames:
+                # Dynamic alpha from the actual block duration, guarded against extremes
+                a = np.float32(min(1.0, max(0.001, (frames / SAMPLE_RATE) / max(0.5, SMOOTH_SEC))))
+                alpha_frames = frames
+            ema = (one - a) * ema + a * x
+
+        if mode == STATE_ACTIVE:
+            event_blocks += 1
+            event_sum += ema
+            if ema > event_peak:
+                event_peak = ema
+
+            if ema >= thr_low:
+                last_above = t
+            elif (t - last_above) >= STOP_HOLD_S:
+                mode = STATE_IDLE
+                out_events[n_events, EV_START] = event_start
+                out_events[n_events, EV_END] = t
+                out_events[n_events, EV_AVG_RMS] = event_sum / max(1, event_blocks)
+                out_events[n_events, EV_PEAK_RMS] = event_peak
+                out_events[n_events, EV_BLOCKS] = event_blocks
+                n_events += 1
+        elif ema >= thr_high:
+            if mode == STATE_IDLE:
+                mode = STATE_CANDIDATE
+                candidate_since = t
+            if (t - candidate_since) >= MIN_DURATION_S:
+                mode = STATE_ACTIVE
+                event_start = candidate_since
+                last_above = t
+                event_blocks = 0
+                event_sum = np.float32(0.0)
+                event_peak = np.float32(0.0)
+        else:
+            mode = STATE_IDLE
+
+        out_smooth[k] = ema
+        out_mode[k] = mode
+
+    levels[LV_EMA] = ema
+    state[ST_MODE] = mode
+    state[ST_CANDIDATE_SINCE] = candidate_since
+    state[ST_EVENT_START] = event_start
+    state[ST_LAST_ABOVE] = last_above
+    state[ST_EVENT_BLOCKS] = event_blocks
+    levels[LV_EVENT_SUM] = event_sum
+    levels[LV_EVENT_PEAK] = event_peak
+    levels[LV_ALPHA] = a
+    state[ST_ALPHA_FRAMES] = alpha_frames
+    return n_events
 
 def dbfs_from_rms(rms: float) -> float:
-    rms = max(float(rms), 1e-12)
-    return 20.0 * np.log10(rms)
+    # math.log10 on a plain float avoids numpy ufunc dispatch for a scalar
+    rms = float(rms)
+    return 20.0 * math.log10(rms if rms > 1e-12 else 1e-12)
+
+def refresh_wall_anchor() -> None:
+    global T0_WALL, T0_MONO
+    T0_WALL = datetime.now().astimezone()
+    T0_MONO = time.monotonic()
+
+def wall_from_mono(t_mono: float) -> datetime:
+    return T0_WALL + timedelta(seconds=t_mono - T0_MONO)
 
 def ensure_csv_header(path: str, header: list[str]) -> None:
     new_file = not os.path.exists(path) or os.path.getsize(path) == 0
@@ -52,6 +221,93 @@ def ensure_csv_header(path: str, header: list[str]) -> None:
         with open(path, "w", newline="", encoding="utf-8") as f:
             csv.writer(f).writerow(header)
 
+class CsvLog:
+    """Append-only CSV kept open for the whole run, with batched flush + fsync.
+
+    Rows are preformatted lines: the schema is numbers and ISO timestamps only,
+    so no csv quoting is needed.
+    """
+
+    def __init__(self, path: str, header: list[str]) -> None:
+        self.path = path
+        ensure_csv_header(path, header)
+        self._f = open(path, "a", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE)
+        self._pending_lines = 0
+        self._last_flush = time.monotonic()
+
+    def write_line(self, line: str) -> None:
+        self._f.write(line)
+        self._pending_lines += 1
+        self.maybe_flush()
+
+    def maybe_flush(self) -> None:
+        if not self._pending_lines:
+            return
+        if (self._pending_lines >= FLUSH_EVERY_LINES
+                or time.monotonic() - self._last_flush > FLUSH_INTERVAL_S):
+            self.flush()
+
+    def flush(self) -> None:
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        self._pending_lines = 0
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        if self._f.closed:
+            return
+        self.flush()
+        self._f.close()
+
+def set_thread_qos(qos_class: int) -> None:
+    # macOS only: ask the scheduler to favour (or deprioritize) the calling thread.
+    if sys.platform != "darwin":
+        return
+    try:
+        libsystem = ctypes.CDLL("/usr/lib/libSystem.B.dylib")
+        err = libsystem.pthread_set_qos_class_self_np(ctypes.c_uint(qos_class), ctypes.c_int(0))
+    except (OSError, AttributeError) as e:
+        print(f"[WARN] Could not set thread QoS: {e}")
+        return
+    if err:
+        print(f"[WARN] Could not set thread QoS: {os.strerror(err)}")
+
+def csv_writer_thread(log_q: queue.Queue, logs: list[CsvLog]) -> None:
+    # Owns all file I/O: drains (CsvLog, line) items until it receives None.
+    # I/O errors (disk full, volume removed) are reported and the thread keeps going.
+    set_thread_qos(QOS_CLASS_UTILITY)
+    failing = False
+    while True:
+        try:
+            item = log_q.get(timeout=FLUSH_INTERVAL_S)
+        except queue.Empty:
+            item = ()
+        if item is None:
+            return
+        try:
+            if item:
+                log, line = item
+                log.write_line(line)
+            # Flush rows left in the buffers once they are old enough
+            for log in logs:
+                log.maybe_flush()
+        except OSError as e:
+            if not failing:
+                print(f"[ERROR] CSV write failed, rows are being lost: {e}")
+                failing = True
+            continue
+        if failing:
+            print("[INFO] CSV writes recovered.")
+            failing = False
+
+def overflow_reporter(stop: threading.Event) -> None:
+    # Wakes only every OVERFLOW_REPORT_S, so the main loop never has to poll the clock.
+    global overflow_count
+    while not stop.wait(OVERFLOW_REPORT_S):
+        if overflow_count:
+            print(f"[WARN] Input overflows: {overflow_count} (check LATENCY and CPU load)")
+            overflow_count = 0
+
 def pick_input_device(spec=None):
     if spec is None:
         return None
@@ -71,52 +327,59 @@ def audio_callback(indata, frames, time_info, status):
     if status and status.input_overflow:
         overflow_count += 1
 
-    # indata: float32, shape (frames, channels)
-    if indata.ndim == 2 and indata.shape[1] > 1:
-        mono = np.mean(indata, axis=1, dtype=np.float32)
-    else:
-        mono = indata.reshape(-1)
-
-    # Block RMS
-    rms = float(np.sqrt(np.mean(mono * mono) + 1e-12))
-    ts = datetime.now().astimezone()
-    try:
-        q.put_nowait((rms, frames, ts))
-    except queue.Full:
+    head = rb_head.value
+    if head - rb_tail.value >= RB_SIZE:
         # If main thread is busy, silently drop the block.
-        pass
+        return
+    idx = head & RB_MASK
+    # indata: float32, shape (frames, channels). Block RMS of the mono downmix.
+    _store_block(indata, frames, indata.shape[1], idx, rb_rms, rb_frames)
+    rb_ts[idx] = time.monotonic()
+    # Publish the slot only after it is fully written.
+    rb_head.value = head + 1
 
 def main():
+    # The main thread must keep draining the ring even when other apps compete for CPU
+    set_thread_qos(QOS_CLASS_USER_INITIATED)
     device_index = pick_input_device(INPUT_DEVICE)
 
-    ensure_csv_header(EVENTS_CSV, [
+    events_log = CsvLog(EVENTS_CSV, [
         "start_time_local", "end_time_local", "duration_s",
         "avg_dbfs", "peak_dbfs", "threshold_dbfs", "blocks"
     ])
+    levels_log = None
     if WRITE_LEVELS_CSV:
-        ensure_csv_header(LEVELS_CSV, ["time_local", "dbfs_block", "dbfs_smooth", "threshold_dbfs", "status"])
-
-    threshold_high = THRESHOLD_DBFS
-    threshold_low = THRESHOLD_DBFS - HYSTERESIS_DB
+        levels_log = CsvLog(LEVELS_CSV, ["time_local", "dbfs_block", "dbfs_smooth", "threshold_dbfs", "status"])
 
-    # Detector state
-    ema_rms = None
-    # For dynamic alpha, use actual block duration from callback
-    def alpha_for(block_sec: float) -> float:
-        # Guard against extreme values
-        return min(1.0, max(0.001, block_sec / max(0.5, SMOOTH_SEC)))
+    # Detection never blocks on disk: rows go to a dedicated writer thread
+    log_q = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    writer = threading.Thread(
+        target=csv_writer_thread,
+        args=(log_q, [log for log in (events_log, levels_log) if log is not None]),
+        name="csv-writer",
+        daemon=True,
+    )
+    writer.start()
 
-    candidate_above_since_wall = None
-    candidate_above_since_mono = None
+    stop_reporter = threading.Event()
+    reporter = threading.Thread(
+        target=overflow_reporter, args=(stop_reporter,), name="overflow-reporter", daemon=True
+    )
+    reporter.start()
 
-    event_active = False
-    event_start_wall = None
-    event_start_mono = None
-    last_above_mono = None
+    # Compare in the linear RMS domain; dBFS is only computed for logged rows
+    rms_thr_high = 10.0 ** (THRESHOLD_DBFS / 20.0)
+    rms_thr_low = 10.0 ** ((THRESHOLD_DBFS - HYSTERESIS_DB) / 20.0)
 
-    event_blocks = 0
-    event_sum_rms = 0.0
-    event_peak_rms = 0.0
+    # Detector state (see ST_*/LV_* slots) and per-batch outputs of run_detector()
+    det_state = np.zeros(DET_STATE_SIZE, dtype=np.float64)
+    det_state[ST_MODE] = STATE_IDLE
+    det_state[ST_ALPHA_FRAMES] = -1
+    det_levels = np.zeros(DET_LEVELS_SIZE, dtype=np.float32)
+    det_levels[LV_EMA] = -1.0
+    block_smooth = np.empty(RB_SIZE, dtype=np.float32)
+    block_mode = np.empty(RB_SIZE, dtype=np.int8)
+    events = np.empty((RB_SIZE, 5), dtype=np.float64)
 
     print("[INFO] Started. Press Ctrl+C to exit.")
     print(f"[INFO] Threshold {THRESHOLD_DBFS} dBFS, minimum {MIN_DURATION_S}s, hysteresis {HYSTERESIS_DB} dB")
@@ -134,102 +397,89 @@ def main():
             blocksize=CALLBACK_BLOCKSIZE,
             callback=audio_callback,
         ):
-            last_overflow_report = time.monotonic()
             while True:
-                try:
-                    rms, frames, t_wall = q.get(timeout=1.0)
-                except queue.Empty:
-                    # Periodically show overflow count if any
-                    now = time.monotonic()
-                    if overflow_count and now - last_overflow_report > 5:
-                        print(f"[WARN] Input overflows: {overflow_count} (check LATENCY and CPU load)")
-                        overflow_count = 0
-                        last_overflow_report = now
+                tail = rb_tail.value
+                head = rb_head.value
+                if tail == head:
+                    time.sleep(POLL_INTERVAL_S)
                     continue
 
-                block_sec = frames / float(SAMPLE_RATE)
-                a = alpha_for(block_sec)
-
-                # EMA
-                if ema_rms is None:
-                    ema_rms = rms
-                else:
-                    ema_rms = (1.0 - a) * ema_rms + a * rms
-
-                block_db = dbfs_from_rms(rms)
-                smooth_db = dbfs_from_rms(ema_rms)
-
-                t_mono = time.monotonic()
-                status = "idle"
-
-                if not event_active:
-                    if smooth_db >= threshold_high:
-                        if candidate_above_since_mono is None:
-                            candidate_above_since_mono = t_mono
-                            candidate_above_since_wall = t_wall
-                        if (t_mono - candidate_above_since_mono) >= MIN_DURATION_S:
-                            event_active = True
-                            event_start_mono = candidate_above_since_mono
-                            event_start_wall = candidate_above_since_wall
-                            last_above_mono = t_mono
-                            event_blocks = 0
-                            event_sum_rms = 0.0
-                            event_peak_rms = 0.0
-                            status = "train_active"
-                    else:
-                        candidate_above_since_mono = None
-                        candidate_above_since_wall = None
-                else:
-                    event_blocks += 1
-                    event_sum_rms += ema_rms
-                    if ema_rms > event_peak_rms:
-                        event_peak_rms = ema_rms
-
-                    if smooth_db >= threshold_low:
-                        last_above_mono = t_mono
-
-                    if last_above_mono is not None and (t_mono - last_above_mono) >= STOP_HOLD_S:
-                        event_active = False
-                        end_wall = t_wall
-                        duration_s = max(0.0, t_mono - (event_start_mono or t_mono))
-                        avg_rms = event_sum_rms / max(1, event_blocks)
-                        avg_db = dbfs_from_rms(avg_rms)
-                        peak_db = dbfs_from_rms(max(1e-12, event_peak_rms))
-
-                        with open(EVENTS_CSV, "a", newline="", encoding="utf-8") as f:
-                            csv.writer(f).writerow([
-                                event_start_wall.isoformat(timespec="seconds"),
-                                end_wall.isoformat(timespec="seconds"),
-                                f"{duration_s:.1f}",
-                                f"{avg_db:.1f}",
-                                f"{peak_db:.1f}",
-                                f"{THRESHOLD_DBFS:.1f}",
-                                event_blocks
-                            ])
-
-                        print(f"[EVENT] Train: {event_start_wall.isoformat(timespec='seconds')} -> "
-                              f"{end_wall.isoformat(timespec='seconds')}, {duration_s:.1f}s, "
-                              f"avg {avg_db:.1f}, peak {peak_db:.1f}")
-                        candidate_above_since_mono = None
-                        candidate_above_since_wall = None
-                    else:
-                        status = "train_active"
-
-                if WRITE_LEVELS_CSV:
-                    with open(LEVELS_CSV, "a", newline="", encoding="utf-8") as f:
-                        csv.writer(f).writerow([
-                            t_wall.isoformat(timespec="seconds"),
-                            f"{block_db:.1f}",
-                            f"{smooth_db:.1f}",
-                            f"{THRESHOLD_DBFS:.1f}",
-                            status
-                        ])
+                n_events = run_detector(rb_rms, rb_frames, rb_ts, tail, head,
+                                        rms_thr_low, rms_thr_high, det_state, det_levels,
+                                        block_smooth, block_mode, events)
+
+                if levels_log is not None or n_events:
+                    refresh_wall_anchor()
+
+                if levels_log is not None:
+                    for k in range(head - tail):
+                        idx = (tail + k) & RB_MASK
+                        line = (
+                            f"{wall_from_mono(float(rb_ts[idx])).isoformat(timespec='seconds')},"
+                            f"{dbfs_from_rms(rb_rms[idx]):.1f},"
+                            f"{dbfs_from_rms(block_smooth[k]):.1f},"
+                            f"{THRESHOLD_DBFS:.1f},"
+                            f"{STATE_STATUS[block_mode[k]]}{CSV_EOL}"
+                        )
+                        try:
+                            log_q.put_nowait((levels_log, line))
+                        except queue.Full:
+                            # If the writer is stuck on disk, drop level rows rather than stall.
+                            pass
+
+                for e in range(n_events):
+                    start_mono, end_mono, avg_rms, peak_rms, event_blocks = events[e]
+                    event_start_wall = wall_from_mono(start_mono)
+                    end_wall = wall_from_mono(end_mono)
+                    duration_s = max(0.0, end_mono - start_mono)
+                    avg_db = dbfs_from_rms(avg_rms)
+                    peak_db = dbfs_from_rms(peak_rms)
+
+                    line = (
+                        f"{event_start_wall.isoformat(timespec='seconds')},"
+                        f"{end_wall.isoformat(timespec='seconds')},"
+                        f"{duration_s:.1f},"
+                        f"{avg_db:.1f},"
+                        f"{peak_db:.1f},"
+                        f"{THRESHOLD_DBFS:.1f},"
+                        f"{int(event_blocks)}{CSV_EOL}"
+                    )
+                    # Events are rare: wait a little for queue space rather than drop them,
+                    # but never stall detection on a stuck writer.
+                    try:
+                        log_q.put((events_log, line), timeout=LOG_WAIT_S)
+                    except queue.Full:
+                        print("[ERROR] CSV writer is not keeping up, event row not logged.")
+
+                    print(f"[EVENT] Train: {event_start_wall.isoformat(timespec='seconds')} -> "
+                          f"{end_wall.isoformat(timespec='seconds')}, {duration_s:.1f}s, "
+                          f"avg {avg_db:.1f}, peak {peak_db:.1f}")
+
+                # Slots are free for the callback only once processed
+                rb_tail.value = head
 
     except KeyboardInterrupt:
         print("\n[INFO] Stopped by user.")
     except Exception as e:
         print(f"[ERROR] {e}")
         sys.exit(1)
+    finally:
+        stop_reporter.set()
+        try:
+            log_q.put(None, timeout=LOG_WAIT_S)
+        except queue.Full:
+            pass
+        writer.join(LOG_WAIT_S)
+        if writer.is_alive():
+            print("[WARN] CSV writer did not stop, unflushed rows may be lost.")
+        else:
+            for log in (events_log, levels_log):
+                if log is None:
+                    continue
+                try:
+                    log.close()
+                except OSError as e:
+                    print(f"[ERROR] Could not close {log.path}: {e}")
 
 if __name__ == "__main__":
     main()